@@ -1,16 +1,37 @@
 import os
+import pathlib
+import posixpath
+import asyncio
+import hashlib
+import functools
 import shutil
+import tempfile
 import subprocess
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import (
+    ClientError,
+    ConnectionClosedError,
+    EndpointConnectionError,
+    ReadTimeoutError,
+)
 
 import bittensor as bt
 import mimetypes
-from typing import Callable, Optional, Union
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple, Union
 
 from atom.utils import run_command
 from atom.chain.chain_utils import json_reader
 from abc import ABC, abstractmethod
 
+try:
+    import fcntl
+except ImportError:  # Not available on Windows, the mirror is then used without locking.
+    fcntl = None
+
 S3_CONFIG = {
     "region_name": os.getenv("S3_REGION"),
     "endpoint_url": os.getenv("S3_ENDPOINT"),
@@ -18,6 +39,88 @@ S3_CONFIG = {
     "secret_access_key": os.getenv("S3_SECRET"),
 }
 
+# The whole retry budget of an S3 request, first attempt included. Retries are left to botocore's
+# adaptive mode, which backs off with jitter on throttling, timeouts, 5xx and dropped connections.
+S3_MAX_ATTEMPTS = 10
+
+# Pool sized for concurrent transfers.
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    retries={"max_attempts": S3_MAX_ATTEMPTS, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
+
+# Errors the client retries, failing with one of them means the retry budget was spent.
+S3_RETRYABLE_ERROR_CODES = {
+    "SlowDown",
+    "RequestTimeout",
+    "ServiceUnavailable",
+    "InternalError",
+    "Throttling",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _s3_transfer_config(max_concurrency: int) -> TransferConfig:
+    """Returns the transfer configuration with `max_concurrency` threads per transfer."""
+    return TransferConfig(
+        multipart_threshold=8 * 1024 * 1024,
+        multipart_chunksize=8 * 1024 * 1024,
+        max_concurrency=max_concurrency,
+        io_chunksize=256 * 1024,
+        use_threads=True,
+    )
+
+
+# Files above the threshold are transferred in parts, concurrently.
+S3_TRANSFER_CONFIG = _s3_transfer_config(16)
+# Buffer size of the local files streamed to and from S3.
+S3_FILE_BUFFERING = 1024 * 1024
+
+
+def _fast_rmtree(path: str):
+    """Removes a directory tree with a single `rm -rf` call, falling back to `shutil.rmtree`.
+
+    Args:
+        path (str): The directory to remove.
+    """
+    if os.name == "posix" and shutil.which("rm"):
+        subprocess.run(["rm", "-rf", path], check=False)
+    else:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+@functools.lru_cache(maxsize=1024)
+def _guess_ct(suffixes: str) -> Optional[str]:
+    """Returns the MIME type registered for the suffixes of a file name, e.g. ".tar.gz", or None if unknown.
+
+    All suffixes are kept, compound ones change the type: ".tar.gz" is a tar archive, ".gz" alone is unknown.
+    """
+    return mimetypes.guess_type(f"file{suffixes}")[0]
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether a failed S3 operation is transient, e.g. throttling but not a missing key."""
+    if isinstance(error, ClientError):
+        code = error.response.get("Error", {}).get("Code")
+        status = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+        return code in S3_RETRYABLE_ERROR_CODES or status >= 500
+    return isinstance(
+        error, (ConnectionClosedError, EndpointConnectionError, ReadTimeoutError)
+    )
+
+
+def _describe_s3_error(error: Exception) -> str:
+    """Describes a failed S3 operation for the logs, telling transient errors from permanent ones."""
+    if _is_retryable(error):
+        return f"transient error, gave up after {S3_MAX_ATTEMPTS} attempts: {error}"
+    return f"permanent error: {error}"
+
+
+class FileNotInCommitError(LookupError):
+    """Raised when a path does not name a file in the requested commit."""
+
+
 class BaseHandler(ABC):
     @abstractmethod
     def get(self):
@@ -29,74 +132,158 @@ class BaseHandler(ABC):
 
 
 class GithubHandler(BaseHandler):
+    _MIRROR_ROOT = os.path.expanduser("~/.cache/atom/mirrors")
+
     def __init__(self, repo_url: str):
         self.REPO_URL = repo_url
 
         self.original_dir = os.getcwd()
         self.repo_name = self.REPO_URL.split("/")[-1].replace(".git", "")
         self.repo_path = os.path.join(self.original_dir, self.repo_name)
+        # Keyed by the full URL, repositories with the same name from different owners get their own mirror.
+        url_digest = hashlib.sha256(self.REPO_URL.encode()).hexdigest()[:16]
+        self.mirror_path = os.path.join(
+            self._MIRROR_ROOT, f"{self.repo_name}-{url_digest}.git"
+        )
+
+    @contextmanager
+    def _mirror_lock(self):
+        """Serializes access to the local mirror across processes."""
+        os.makedirs(self._MIRROR_ROOT, exist_ok=True)
+        with open(self.mirror_path + ".lock", "w") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
 
     def clone(self):
-        """Clones the self.REPO_URL repository into the current directory."""
-        if not os.path.exists(self.repo_path):
-            try:
+        """Creates a blobless bare mirror of self.REPO_URL in the cache, or updates it if it already exists."""
+        try:
+            if not os.path.exists(self.mirror_path):
                 bt.logging.info(f"Cloning repository: {self.REPO_URL}")
-                run_command(command=["git", "clone", self.REPO_URL])
-            except subprocess.CalledProcessError as e:
-                bt.logging.error(f"An error occurred during Git operations: {e}")
+                run_command(
+                    command=[
+                        "git",
+                        "clone",
+                        "--mirror",
+                        "--filter=blob:none",
+                        self.REPO_URL,
+                        self.mirror_path,
+                    ]
+                )
+            else:
+                bt.logging.info(f"Updating mirror: {self.mirror_path}")
+                run_command(["git", "fetch", "--prune", "origin"], cwd=self.mirror_path)
+        except subprocess.CalledProcessError as e:
+            bt.logging.error(f"An error occurred during Git operations: {e}")
+
+    def fetch_commit(self, commit_sha: str):
+        """Fetches a single commit into the mirror, unless it is already there."""
+        has_commit = (
+            subprocess.run(
+                ["git", "cat-file", "-e", f"{commit_sha}^{{commit}}"],
+                cwd=self.mirror_path,
+                capture_output=True,
+            ).returncode
+            == 0
+        )
+        if not has_commit:
+            bt.logging.info(f"Fetching commit: {commit_sha}")
+            run_command(["git", "fetch", "origin", commit_sha], cwd=self.mirror_path)
 
     def fetch_all(self):
         """Fetch all changes from self.REPO_URL repository."""
         try:
             bt.logging.info("Fetching latest changes")
-            run_command(["git", "fetch", "--all"], cwd=self.repo_path)
+            run_command(["git", "fetch", "--all"], cwd=self.mirror_path)
 
         except subprocess.CalledProcessError as e:
             bt.logging.error(f"An error occurred during Git operations: {e}")
             return None
 
-    def get(self, commit_sha: str, filepath: str, reader: Callable = json_reader):
+    def get(
+        self,
+        commit_sha: str,
+        filepath: str,
+        reader: Callable = json_reader,
+        blob_reader: Optional[Callable[[bytes], Any]] = None,
+    ):
         """Get content from a specific commit in the repository.
 
         Args:
-            commit_sha (str): The commit hash to checkout.
+            commit_sha (str): The commit to read from.
             filepath (str): The path to the file to read. Usually identified through the hotkey, f"{hotkey}.json"
             reader (Callable, optional): Function that reads the datatype specified. Defaults to json_reader.
+            blob_reader (Callable[[bytes], Any], optional): Function that parses the raw file contents in memory,
+                e.g. `json.loads`. When given, it is used instead of `reader` and nothing is written to disk.
 
         Returns:
             content: The content of the file in the specified commit.
         """
 
         try:
-            # Clone and fetch all changes from the repo.
-            self.clone()
-            self.fetch_all()
-
-            bt.logging.info(f"Checking out commit: {commit_sha}")
-            subprocess.run(
-                ["git", "checkout", commit_sha], check=True, capture_output=True
-            )
-
-            if os.path.exists(filepath):
-                bt.logging.info(f"File '{filepath}' found. Reading contents...")
-                content = reader(filepath)
-                return content
-            else:
-                bt.logging.error(f"File '{filepath}' not found in this commit.")
-                return None
+            with self._mirror_lock():
+                # Commits are immutable, so an existing mirror only needs the requested one.
+                if os.path.exists(self.mirror_path):
+                    self.fetch_commit(commit_sha)
+                else:
+                    self.clone()
+
+                # `clone` logs and swallows its errors, a failed clone leaves no mirror behind.
+                if not os.path.exists(self.mirror_path):
+                    bt.logging.error(f"No mirror of {self.REPO_URL} to read from.")
+                    return None
+
+                bt.logging.info(f"Reading '{filepath}' at commit: {commit_sha}")
+                blob = self._read_blob(commit_sha, filepath)
+
+            if blob_reader is not None:
+                return blob_reader(blob)
+
+            # The reader expects a path, so only the requested file is written to disk.
+            with tempfile.NamedTemporaryFile(
+                "wb", suffix=os.path.splitext(filepath)[1], delete=False
+            ) as file:
+                file.write(blob)
+            try:
+                return reader(file.name)
+            finally:
+                os.remove(file.name)
 
+        except FileNotInCommitError:
+            bt.logging.error(f"File '{filepath}' not found in this commit.")
+            return None
         except subprocess.CalledProcessError as e:
             bt.logging.error(f"An error occurred during Git operations: {e}")
             return None
         except IOError as e:
             bt.logging.error(f"An error occurred while reading the file: {e}")
             return None
-        finally:
-            if os.path.exists(self.repo_path):
-                bt.logging.info(
-                    f"Deleting the cloned repository folder: {self.repo_name}"
-                )
-                shutil.rmtree(self.repo_path)
+
+    def _read_blob(self, commit_sha: str, filepath: str) -> bytes:
+        """Reads the raw bytes of a file at a commit from the mirror.
+
+        Raises:
+            FileNotInCommitError: If the file does not exist in the commit.
+        """
+        # `--batch` reports a missing object in its output instead of failing, so no existence check is needed.
+        output = subprocess.run(
+            ["git", "cat-file", "--batch"],
+            input=f"{commit_sha}:{filepath}\n".encode(),
+            check=True,
+            capture_output=True,
+            cwd=self.mirror_path,
+        ).stdout
+
+        # The output is "<sha> <type> <size>\n<contents>\n", or "<name> missing\n".
+        header, _, contents = output.partition(b"\n")
+        fields = header.split()
+        if len(fields) != 3 or fields[1] != b"blob":
+            raise FileNotInCommitError(filepath)
+        return contents[: int(fields[2])]
 
     def put(
         self,
@@ -116,60 +303,130 @@ class GithubHandler(BaseHandler):
             branch_name (str): The branch to commit the changes to. E.g. "main"
 
         Returns:
-            str: _description_
+            str: The commit hash of the remote branch after pushing.
         """
+        return self._commit_files(
+            entries=[
+                {
+                    "content": content,
+                    "folder_name": folder_name,
+                    "file_ext": file_ext,
+                    "hotkey": hotkey,
+                }
+            ],
+            message=f"{hotkey} added file",
+            branch_name=branch_name,
+        )
+
+    def put_batch(self, entries: List[dict], branch_name: str = "main") -> str:
+        """Put several files into the repository with a single commit and push.
 
-        self.clone()
-
-        # all the operations will be done in the cloned repository folder.
-        os.chdir(self.repo_path)
-
-        bt.logging.info(f"Checking out and updating branch: {branch_name}")
-        run_command(["git", "checkout", branch_name])
-        run_command(["git", "pull", "origin", branch_name])
-
-        # If for any reason the folder to be written into was deleted, create the folder.
-        if not os.path.exists(folder_name):
-            bt.logging.info(f"Creating folder: {folder_name}")
-            os.mkdir(os.path.join(self.repo_path, folder_name))
-
-        filename = os.path.join(folder_name, f"{hotkey}.{file_ext}")
-
-        bt.logging.info(f"Creating file: {filename}")
-        with open(filename, "w") as f:
-            f.write(content)
-
-        bt.logging.info("Staging, committing, and pushing changes")
-
-        try:
-            run_command(["git", "add", filename])
-            run_command(["git", "commit", "-m", f"{hotkey} added file"])
-            run_command(["git", "push", "origin", branch_name])
-        except subprocess.CalledProcessError:
-            bt.logging.warning(
-                "What you're currently trying to commit has no differences to your last commit. Proceeding with last commit..."
-            )
+        Args:
+            entries (List[dict]): The files to write, each with the `content`, `folder_name`, `file_ext` and
+                `hotkey` arguments of `put`.
+            branch_name (str): The branch to commit the changes to. E.g. "main"
 
-        bt.logging.info("Retrieving commit hash")
-        local_commit_hash = run_command(["git", "rev-parse", "HEAD"])
+        Returns:
+            str: The commit hash of the remote branch after pushing.
+        """
+        return self._commit_files(
+            entries=entries,
+            message=f"{len(entries)} files added",
+            branch_name=branch_name,
+        )
+
+    def _commit_files(
+        self, entries: List[dict], message: str, branch_name: str
+    ) -> str:
+        """Writes the entries into a worktree of the mirror, then commits and pushes them to the branch."""
+        with self._mirror_lock():
+            self.clone()
 
-        run_command(["git", "fetch", "origin", branch_name])
-        remote_commit_hash = run_command(["git", "rev-parse", f"origin/{branch_name}"])
+            # Changes are made in a temporary worktree of the mirror, which is removed even if the checkout fails.
+            worktree_path = tempfile.mkdtemp(prefix=f"{self.repo_name}-")
+            try:
+                bt.logging.info(f"Checking out branch: {branch_name}")
+                # Quiet checkout, so no per-file output is buffered; errors still come through stderr.
+                run_command(
+                    [
+                        "git",
+                        "-c",
+                        "advice.detachedHead=false",
+                        "worktree",
+                        "add",
+                        "--quiet",
+                        "--detach",
+                        worktree_path,
+                        branch_name,
+                    ],
+                    cwd=self.mirror_path,
+                )
 
-        if local_commit_hash == remote_commit_hash:
-            bt.logging.info(f"Successfully pushed. Commit hash: {local_commit_hash}")
-        else:
-            bt.logging.warning("Local and remote commit hashes differ.")
-            bt.logging.warning(f"Local commit hash: {local_commit_hash}")
-            bt.logging.warning(f"Remote commit hash: {remote_commit_hash}")
+                # Folders already ensured in this worktree, entries often share one.
+                created_folders = set()
+
+                def write_file(entry: dict) -> str:
+                    folder_name = entry["folder_name"]
+                    # If for any reason the folder to be written into was deleted, create the folder.
+                    if folder_name not in created_folders:
+                        os.makedirs(os.path.join(worktree_path, folder_name), exist_ok=True)
+                        created_folders.add(folder_name)
+
+                    filename = os.path.join(
+                        folder_name, f"{entry['hotkey']}.{entry['file_ext']}"
+                    )
+
+                    bt.logging.info(f"Creating file: {filename}")
+                    with open(os.path.join(worktree_path, filename), "w") as f:
+                        f.write(entry["content"])
+                    return filename
+
+                with ThreadPoolExecutor() as executor:
+                    filenames = list(executor.map(write_file, entries))
+
+                bt.logging.info("Staging, committing, and pushing changes")
+
+                # All git operations run in the worktree folder, without changing the process' cwd.
+                try:
+                    run_command(["git", "add", *filenames], cwd=worktree_path)
+                    run_command(["git", "commit", "-m", message], cwd=worktree_path)
+                    # Push to the URL directly, the mirror's origin is configured for `--mirror` pushes.
+                    run_command(
+                        ["git", "push", self.REPO_URL, f"HEAD:refs/heads/{branch_name}"],
+                        cwd=worktree_path,
+                    )
+                except subprocess.CalledProcessError:
+                    bt.logging.warning(
+                        "What you're currently trying to commit has no differences to your last commit. Proceeding with last commit..."
+                    )
+
+                bt.logging.info("Retrieving commit hash")
+                local_commit_hash = run_command(
+                    ["git", "rev-parse", "HEAD"], cwd=worktree_path
+                )
 
-        os.chdir("..")
-        bt.logging.info(f"Deleting the cloned repository folder: {self.repo_name}")
-        shutil.rmtree(self.repo_name)
+                remote_commit_hash = run_command(
+                    ["git", "ls-remote", self.REPO_URL, f"refs/heads/{branch_name}"],
+                    cwd=worktree_path,
+                ).split("\t")[0]
+
+                if local_commit_hash == remote_commit_hash:
+                    bt.logging.info(
+                        f"Successfully pushed. Commit hash: {local_commit_hash}"
+                    )
+                else:
+                    bt.logging.warning("Local and remote commit hashes differ.")
+                    bt.logging.warning(f"Local commit hash: {local_commit_hash}")
+                    bt.logging.warning(f"Remote commit hash: {remote_commit_hash}")
+            finally:
+                bt.logging.info(f"Removing the worktree: {worktree_path}")
+                _fast_rmtree(worktree_path)
+                if os.path.exists(self.mirror_path):
+                    run_command(["git", "worktree", "prune"], cwd=self.mirror_path)
 
         return remote_commit_hash
 
-def create_s3_client(region_name: str, endpoint_url: str, access_key_id: str, secret_access_key: str) -> boto3.client:
+def create_s3_client(region_name: str, endpoint_url: str, access_key_id: str, secret_access_key: str, config: Config = S3_CLIENT_CONFIG) -> boto3.client:
     """
     Creates and returns an S3 client.
 
@@ -178,6 +435,7 @@ def create_s3_client(region_name: str, endpoint_url: str, access_key_id: str, se
         endpoint_url (str): The endpoint URL
         access_key_id (str): The access key ID
         secret_access_key (str): The secret access key
+        config (Config, optional): The botocore client configuration. Defaults to S3_CLIENT_CONFIG.
 
     Returns:
         boto3.client: An S3 client instance
@@ -188,6 +446,7 @@ def create_s3_client(region_name: str, endpoint_url: str, access_key_id: str, se
         endpoint_url=endpoint_url,
         aws_access_key_id=access_key_id,
         aws_secret_access_key=secret_access_key,
+        config=config,
     )
 
 class S3Handler(BaseHandler):
@@ -196,8 +455,6 @@ class S3Handler(BaseHandler):
     Manages file content retrieval and storage operations using DigitalOcean Spaces S3.
     """
 
-    s3_client = create_s3_client(**S3_CONFIG)
-
     def __init__(
         self,
         bucket_name: str,
@@ -209,20 +466,28 @@ class S3Handler(BaseHandler):
 
         Args:
         bucket_name (str): The name of the s3 bucket to interact with.
-        s3_client: The s3 client to interact with the bucket. Defaults to None.
+        s3_client: The s3 client to interact with the bucket. Defaults to a client shared by all handlers,
+            created from S3_CONFIG on first use.
         custom_mime_types (dict[str, str], optional): A dictionary of custom mime types for specific file extensions. Defaults to None.
         """
 
         self.bucket_name = bucket_name
-        self.s3_client = s3_client or self.default_s3_client
+        self.s3_client = s3_client or self._default_client()
         self.custom_mime_types = custom_mime_types or {}
 
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def _default_client(cls):
+        """Creates the shared default client lazily, so importing the module does not start boto3."""
+        return create_s3_client(**S3_CONFIG)
+
     def put(
         self,
         local_file_path: str,
         s3_bucket_location: str,
         content_type: Optional[str] = None,
         public: bool = False,
+        transfer_config: TransferConfig = S3_TRANSFER_CONFIG,
     ) -> Union[str, bool]:
         """
         Upload a file to a specific location in the S3 bucket.
@@ -232,40 +497,101 @@ class S3Handler(BaseHandler):
             s3_bucket_location (str): The destination path within the bucket.
             content_type (str, optional): The MIME type of the file. If not provided, inferred from file extension.
             public (bool): Whether to make the uploaded file publicly accessible. Defaults to False.
+            transfer_config (TransferConfig): The multipart transfer configuration. Defaults to S3_TRANSFER_CONFIG.
 
         Returns:
             Union[str, bool]: The key of the uploaded file if successful, False otherwise.
         """
 
         try:
-            file_name = local_file_path.split("/")[-1]
-            key = os.path.join(s3_bucket_location, file_name)
-
-            with open(local_file_path, "rb") as file:
-                data = file.read()
+            file_name = os.path.basename(local_file_path)
+            # S3 keys are always "/" separated, whatever the local platform.
+            key = posixpath.join(s3_bucket_location, file_name)
 
             # Infer MIME type
-            if not content_type:
-                content_type = (
-                    self.custom_mime_types.get(file_name[file_name.rfind(".") :])
-                    or mimetypes.guess_type(local_file_path)[0]
-                    or "application/octet-stream"
-                )
-
-            # Upload
-            self.s3_client.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=key,
-                Body=data,
-                ContentType=content_type,
-                ACL="public-read" if public else "private",
+            ext = os.path.splitext(file_name)[1]
+            content_type = (
+                content_type
+                or self.custom_mime_types.get(ext)
+                or _guess_ct("".join(pathlib.PurePath(file_name).suffixes))
+                or "application/octet-stream"
             )
+
+            # Stream the upload, in parallel parts for large files.
+            with open(local_file_path, "rb", buffering=S3_FILE_BUFFERING) as file:
+                self.s3_client.upload_fileobj(
+                    file,
+                    self.bucket_name,
+                    key,
+                    ExtraArgs={
+                        "ContentType": content_type,
+                        "ACL": "public-read" if public else "private",
+                    },
+                    Config=transfer_config,
+                )
             return key
         except FileNotFoundError:
+            bt.logging.error(f"File '{local_file_path}' not found.")
+            return False
+        except (
+            ClientError,
+            ConnectionClosedError,
+            EndpointConnectionError,
+            ReadTimeoutError,
+        ) as e:
+            bt.logging.error(
+                f"Upload of '{local_file_path}' failed with a {_describe_s3_error(e)}"
+            )
             return False
         except Exception as e:
+            bt.logging.error(
+                f"An error occurred while uploading '{local_file_path}': {e}"
+            )
             return False
 
+    async def put_many(
+        self,
+        items: List[Tuple[str, str]],
+        public: bool = False,
+        concurrency: int = 32,
+    ) -> List[Union[str, bool]]:
+        """
+        Upload several files to the S3 bucket concurrently.
+
+        Args:
+            items (List[Tuple[str, str]]): Pairs of (local_file_path, s3_bucket_location), as passed to `put`.
+            public (bool): Whether to make the uploaded files publicly accessible. Defaults to False.
+            concurrency (int): The maximum number of uploads running at the same time, at most the size of
+                the client's connection pool. Defaults to 32.
+
+        Returns:
+            List[Union[str, bool]]: The result of `put` for each item, in the same order.
+        """
+        # Split the connection pool between the uploads, instead of each one starting its own 16 threads.
+        pool_size = S3_CLIENT_CONFIG.max_pool_connections
+        concurrency = max(1, min(concurrency, pool_size))
+        transfer_config = _s3_transfer_config(
+            max(1, min(pool_size // concurrency, S3_TRANSFER_CONFIG.max_concurrency))
+        )
+
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        executor,
+                        functools.partial(
+                            self.put,
+                            local_file_path,
+                            s3_bucket_location,
+                            public=public,
+                            transfer_config=transfer_config,
+                        ),
+                    )
+                    for local_file_path, s3_bucket_location in items
+                )
+            )
+
     def get(self, s3_key: str, local_file_path: str) -> bool:
         """Retrieves a file from the S3 bucket.
 
@@ -277,13 +603,27 @@ class S3Handler(BaseHandler):
             bool: True if the file was successfully retrieved and saved, False otherwise.
         """
         try:
-            # Download the object from S3 and save it locally
-            with open(local_file_path, "wb") as file:
-                self.s3_client.s3_client.download_fileobj(
-                    self.bucket_name, s3_key, file
+            # Download the object from S3 in parallel ranges and save it locally
+            with open(local_file_path, "wb", buffering=S3_FILE_BUFFERING) as file:
+                self.s3_client.download_fileobj(
+                    self.bucket_name, s3_key, file, Config=S3_TRANSFER_CONFIG
                 )
             return True
-        except self.s3_client.s3_client.exceptions.NoSuchKey:
+        except self.s3_client.exceptions.NoSuchKey:
+            bt.logging.error(
+                f"Key '{s3_key}' not found in bucket '{self.bucket_name}'."
+            )
+            return False
+        except (
+            ClientError,
+            ConnectionClosedError,
+            EndpointConnectionError,
+            ReadTimeoutError,
+        ) as e:
+            bt.logging.error(
+                f"Download of '{s3_key}' failed with a {_describe_s3_error(e)}"
+            )
             return False
         except Exception as e:
+            bt.logging.error(f"An error occurred while downloading '{s3_key}': {e}")
             return False
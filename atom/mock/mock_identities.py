@@ -105,8 +105,7 @@ class MockOrganicValidator(OrganicScoringBase):
         """
         while not self._should_exit:
             if self._trigger == "steps":
-                while self._step_counter < self._trigger_frequency:
-                    await asyncio.sleep(0.1)
+                await self._wait_for_steps(self._trigger_frequency)
 
             try:
                 await self.forward()
@@ -1,4 +1,6 @@
 import asyncio
+import inspect
+import threading
 from abc import ABC, abstractmethod
 from typing import Any, Literal, Optional, Sequence, Union, Tuple, Callable
 
@@ -10,6 +12,9 @@ from atom.organic_scoring.utils import is_overridden
 
 
 class OrganicScoringBase(ABC):
+    # Runs a blocking call in a worker thread, e.g. `await self.run_sync(handler.put, ...)` from `forward`.
+    run_sync = staticmethod(asyncio.to_thread)
+
     def __init__(
         self,
         axon: bt.axon,
@@ -73,31 +78,53 @@ class OrganicScoringBase(ABC):
         assert (
             self._trigger_scaling_factor > 0
         ), "The scaling factor must be higher than 0."
+        self._inv_scaling_factor = 1.0 / self._trigger_scaling_factor
 
         self._organic_queue = organic_queue
 
         if self._organic_queue is None:
             self._organic_queue = OrganicQueue()
 
+        # Steps are usually incremented from the validator thread, outside of the event loop.
         self._step_counter = 0
-        self._step_lock = asyncio.Lock()
+        self._step_lock = threading.Lock()
+        # Set whenever the step counter changes, so step waiters re-check it instead of polling.
+        # Created by the first waiter, on its running loop: on Python 3.9 an event binds to a loop when created.
+        self._step_event: Optional[asyncio.Event] = None
+        self._step_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Step count the waiter needs, waiters are only woken up once it is reached.
+        self._next_target = self._trigger_frequency
 
         # Bittensor's internal checks require synapse to be a subclass of bt.Synapse.
         # If the methods are not overridden in the derived class, None is passed.
+        overrides = self._handle_overrides()
         self._axon.attach(
             forward_fn=self._on_organic_entry,
-            blacklist_fn=(
-                self._blacklist_fn if is_overridden(self._blacklist_fn) else None
-            ),
-            priority_fn=self._priority_fn if is_overridden(self._priority_fn) else None,
-            verify_fn=self._verify_fn if is_overridden(self._verify_fn) else None,
+            blacklist_fn=self._blacklist_fn if overrides["_blacklist_fn"] else None,
+            priority_fn=self._priority_fn if overrides["_priority_fn"] else None,
+            verify_fn=self._verify_fn if overrides["_verify_fn"] else None,
         )
 
+    def _handle_overrides(self) -> dict[str, bool]:
+        """Returns which optional axon handles are overridden, computed once per subclass."""
+        cls = type(self)
+        # Read from the class' own namespace, a cache inherited from a parent class may not apply.
+        overrides = cls.__dict__.get("_atom_overrides")
+        if overrides is None:
+            overrides = {
+                name: is_overridden(getattr(self, name))
+                for name in ("_blacklist_fn", "_priority_fn", "_verify_fn")
+            }
+            cls._atom_overrides = overrides
+        return overrides
+
     def increment_step(self):
         """Increment the step counter if the trigger is set to `steps`."""
         with self._step_lock:
             if self._trigger == "steps":
                 self._step_counter += 1
+            if self._step_counter >= self._next_target:
+                self._notify_step()
 
     def set_step(self, step: int):
         """Set the step counter to a specific value.
@@ -108,6 +135,28 @@ class OrganicScoringBase(ABC):
         with self._step_lock:
             if self._trigger == "steps":
                 self._step_counter = step
+            if self._step_counter >= self._next_target:
+                self._notify_step()
+
+    def _notify_step(self):
+        """Wake up the step waiters, either from the event loop or from another thread.
+
+        Must be called with `_step_lock` held, so the waiter's loop and event are read consistently.
+        """
+        loop, event = self._step_loop, self._step_event
+        if loop is None or loop.is_closed():
+            # No waiter yet, it checks the counter before waiting.
+            return
+
+        try:
+            in_loop = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            in_loop = False
+
+        if in_loop:
+            event.set()
+        else:
+            loop.call_soon_threadsafe(event.set)
 
     @abstractmethod
     async def _on_organic_entry(self, synapse: bt.Synapse) -> bt.Synapse:
@@ -141,11 +190,14 @@ class OrganicScoringBase(ABC):
         """
         while not self._should_exit:
             if self._trigger == "steps":
-                while self._step_counter < self._trigger_frequency:
-                    await asyncio.sleep(0.1)
+                await self._wait_for_steps(self._trigger_frequency)
 
             try:
-                logs = await self.forward()
+                # A synchronous `forward` runs in a worker thread, so the axon keeps serving organic entries.
+                if inspect.iscoroutinefunction(self.forward):
+                    logs = await self.forward()
+                else:
+                    logs = await self.run_sync(self.forward)
 
                 total_elapsed_time = logs.get("total_elapsed_time", 0)
                 await self.wait_until_next(timer_elapsed=total_elapsed_time)
@@ -164,6 +216,9 @@ class OrganicScoringBase(ABC):
 
         Expected to return a dictionary with information from the sampling method.
         If the trigger is based on seconds, the dictionary should contain the key "total_elapsed_time".
+
+        May also be overridden as a regular method, it is then run in a worker thread. Blocking calls in an
+        async `forward`, e.g. `GithubHandler.put` or `S3Handler.put`, should be wrapped with `self.run_sync`.
         """
         ...
 
@@ -197,17 +252,33 @@ class OrganicScoringBase(ABC):
             await asyncio.sleep(sleep_duration)
         elif self._trigger == "steps":
             # Adjust the steps based on the queue size.
-            while True:
-                if self._step_counter >= dynamic_unit:
-                    self._step_counter -= dynamic_unit
-                else:
-                    await asyncio.sleep(1)
+            await self._wait_for_steps(dynamic_unit)
+            with self._step_lock:
+                self._step_counter -= dynamic_unit
+
+    async def _wait_for_steps(self, steps: int):
+        """Wait until the step counter reaches `steps`, waking up only when the counter changes."""
+        loop = asyncio.get_running_loop()
+        with self._step_lock:
+            if self._step_loop is not loop:
+                self._step_event = asyncio.Event()
+                self._step_loop = loop
+            self._next_target = steps
+            event = self._step_event
+
+        while True:
+            # Wakeups from other threads are scheduled on this loop, so they cannot run between clear and wait.
+            with self._step_lock:
+                if self._step_counter >= steps:
+                    return
+                event.clear()
+            await event.wait()
 
     def sample_rate_dynamic(self) -> float:
         """Returns dynamic sampling rate based on the size of the organic queue."""
         size = self._organic_queue.size
         delay = max(
-            self._trigger_frequency - (size / self._trigger_scaling_factor),
+            self._trigger_frequency - size * self._inv_scaling_factor,
             self._trigger_min,
         )
         return delay if self._trigger == "seconds" else int(delay)
@@ -1,6 +1,17 @@
+import json
 import pytest
-from unittest.mock import MagicMock, patch, mock_open
-from atom.handlers.handler import S3Handler  # Replace `mymodule` with the actual module name
+import asyncio
+import subprocess
+from botocore.exceptions import ClientError
+from unittest.mock import ANY, MagicMock, patch, mock_open
+from atom.handlers.handler import (
+    GithubHandler,
+    S3Handler,
+    S3_CLIENT_CONFIG,
+    S3_MAX_ATTEMPTS,
+    S3_TRANSFER_CONFIG,
+    _is_retryable,
+)  # Replace `mymodule` with the actual module name
 
 @pytest.fixture
 def mock_s3_client():
@@ -25,19 +36,36 @@ def test_put_success(s3_handler, mock_s3_client, tmp_path):
     temp_file = tmp_path / "test.txt"
     temp_file.write_text("Sample data")
 
-    mock_s3_client.s3_client.put_object.return_value = {}
+    mock_s3_client.upload_fileobj.return_value = None
 
     result = s3_handler.put(str(temp_file), "test-folder", public=True)
 
     assert result == "test-folder/test.txt"
-    mock_s3_client.s3_client.put_object.assert_called_once_with(
-        Bucket="test-bucket",
-        Key="test-folder/test.txt",
-        Body=b"Sample data",
-        ContentType="text/plain",
-        ACL="public-read",
+    mock_s3_client.upload_fileobj.assert_called_once_with(
+        ANY,
+        "test-bucket",
+        "test-folder/test.txt",
+        ExtraArgs={"ContentType": "text/plain", "ACL": "public-read"},
+        Config=S3_TRANSFER_CONFIG,
     )
 
+def test_put_custom_mime_type(mock_s3_client, tmp_path):
+    """Test custom MIME types, the octet-stream fallback and compound extensions."""
+    s3_handler = S3Handler(
+        bucket_name="test-bucket",
+        s3_client=mock_s3_client,
+        custom_mime_types={".log": "text/x-log"},
+    )
+    for name in ("run.log", "LICENSE", "archive.tar.gz"):
+        (tmp_path / name).write_text("Sample data")
+        s3_handler.put(str(tmp_path / name), "test-folder")
+
+    content_types = [
+        call.kwargs["ExtraArgs"]["ContentType"]
+        for call in mock_s3_client.upload_fileobj.call_args_list
+    ]
+    assert content_types == ["text/x-log", "application/octet-stream", "application/x-tar"]
+
 def test_put_file_not_found(s3_handler):
     """Test upload with a nonexistent file."""
     result = s3_handler.put("nonexistent_file.txt", "test-folder")
@@ -48,31 +76,179 @@ def test_put_exception(s3_handler, mock_s3_client, tmp_path):
     temp_file = tmp_path / "test.txt"
     temp_file.write_text("Sample data")
 
-    mock_s3_client.s3_client.put_object.side_effect = Exception("Upload error")
+    mock_s3_client.upload_fileobj.side_effect = Exception("Upload error")
+
+    result = s3_handler.put(str(temp_file), "test-folder")
+    assert result is False
+
+def test_put_many(s3_handler, mock_s3_client, tmp_path):
+    """Test concurrent upload of several files."""
+    items = []
+    for name in ("a.txt", "b.txt", "c.txt"):
+        temp_file = tmp_path / name
+        temp_file.write_text("Sample data")
+        items.append((str(temp_file), "test-folder"))
+
+    results = asyncio.run(s3_handler.put_many(items, concurrency=2))
+
+    assert results == ["test-folder/a.txt", "test-folder/b.txt", "test-folder/c.txt"]
+    assert mock_s3_client.upload_fileobj.call_count == 3
+
+    # The connection pool is shared between the concurrent uploads.
+    for call in mock_s3_client.upload_fileobj.call_args_list:
+        config = call.kwargs["Config"]
+        assert config.max_concurrency * 2 <= S3_CLIENT_CONFIG.max_pool_connections
+
+def test_client_retry_budget():
+    """Test that retries are configured once, on the client, with adaptive backoff."""
+    assert S3_CLIENT_CONFIG.retries == {"max_attempts": S3_MAX_ATTEMPTS, "mode": "adaptive"}
+
+def test_put_transient_error(s3_handler, mock_s3_client, tmp_path):
+    """Test that an error the client already retried is not retried again."""
+    temp_file = tmp_path / "test.txt"
+    temp_file.write_text("Sample data")
+
+    slow_down = ClientError({"Error": {"Code": "SlowDown"}}, "PutObject")
+    mock_s3_client.upload_fileobj.side_effect = slow_down
 
     result = s3_handler.put(str(temp_file), "test-folder")
+
     assert result is False
+    assert mock_s3_client.upload_fileobj.call_count == 1
+
+def test_s3_error_classification():
+    """Test that throttling and 5xx errors are transient, while access errors are permanent."""
+    slow_down = ClientError({"Error": {"Code": "SlowDown"}}, "PutObject")
+    server_error = ClientError(
+        {"Error": {"Code": "Unknown"}, "ResponseMetadata": {"HTTPStatusCode": 503}}, "PutObject"
+    )
+    access_denied = ClientError({"Error": {"Code": "AccessDenied"}}, "PutObject")
+
+    assert _is_retryable(slow_down)
+    assert _is_retryable(server_error)
+    assert not _is_retryable(access_denied)
 
 def test_get_success(s3_handler, mock_s3_client, tmp_path):
     """Test successful file download."""
     local_file = tmp_path / "downloaded.txt"
 
     with patch("builtins.open", mock_open()) as mocked_open:
-        mock_s3_client.s3_client.download_fileobj.return_value = None
+        mock_s3_client.download_fileobj.return_value = None
         result = s3_handler.get("test-folder/test.txt", str(local_file))
 
     assert result is True
-    mock_s3_client.s3_client.download_fileobj.assert_called_once_with(
-        "test-bucket", "test-folder/test.txt", mocked_open.return_value
+    mock_s3_client.download_fileobj.assert_called_once_with(
+        "test-bucket", "test-folder/test.txt", mocked_open.return_value, Config=S3_TRANSFER_CONFIG
     )
 
 def test_get_no_such_key(s3_handler, mock_s3_client):
     """Test download with a nonexistent key."""
-    mock_s3_client.s3_client.exceptions = MagicMock()
-    mock_s3_client.s3_client.exceptions.NoSuchKey = FileNotFoundError
+    mock_s3_client.exceptions = MagicMock()
+    mock_s3_client.exceptions.NoSuchKey = FileNotFoundError
 
     # NoSuchKey exception
-    mock_s3_client.s3_client.download_fileobj.side_effect = mock_s3_client.s3_client.exceptions.NoSuchKey("No such key")
+    mock_s3_client.download_fileobj.side_effect = mock_s3_client.exceptions.NoSuchKey("No such key")
 
     result = s3_handler.get("nonexistent-key", "local-path.txt")
-    assert result is False
\ No newline at end of file
+    assert result is False
+
+
+def git(*args, cwd=None):
+    """Runs a git command in the tests and returns its output."""
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+def create_remote(tmp_path, owner: str, files: dict) -> str:
+    """Creates a local bare repository seeded with `files`, and returns its file:// URL."""
+    remote = tmp_path / owner / "data.git"
+    git("init", "--bare", "-b", "main", str(remote))
+    git("config", "uploadpack.allowFilter", "true", cwd=remote)
+    git("config", "uploadpack.allowAnySHA1InWant", "true", cwd=remote)
+
+    seed = tmp_path / owner / "seed"
+    git("clone", str(remote), str(seed))
+    for path, content in files.items():
+        (seed / path).parent.mkdir(parents=True, exist_ok=True)
+        (seed / path).write_text(content)
+    git("add", "-A", cwd=seed)
+    git("commit", "-m", "seed", cwd=seed)
+    git("push", "origin", "HEAD:main", cwd=seed)
+    return f"file://{remote}"
+
+@pytest.fixture
+def github_env(tmp_path, monkeypatch):
+    """Isolates git and the mirror cache from the user's home directory."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    for role in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{role}_NAME", "validator")
+        monkeypatch.setenv(f"GIT_{role}_EMAIL", "validator@example.com")
+    monkeypatch.setattr(GithubHandler, "_MIRROR_ROOT", str(tmp_path / "mirrors"))
+    return tmp_path
+
+@pytest.fixture
+def github_repo(github_env):
+    """A GithubHandler on a remote holding one json file, and the commit hash of that file."""
+    url = create_remote(github_env, "org1", {"data/hk.json": '{"a": 1}\n'})
+    handler = GithubHandler(url)
+    return handler, git("ls-remote", url, "refs/heads/main").split("\t")[0]
+
+def test_github_get(github_repo):
+    """Test reading a file with a path reader and with an in-memory blob reader."""
+    handler, commit = github_repo
+
+    assert handler.get(commit, "data/hk.json") == {"a": 1}
+    assert handler.get(commit, "data/hk.json", blob_reader=bytes) == b'{"a": 1}\n'
+
+def test_github_get_missing_path(github_repo):
+    """Test that missing files and directories are reported as not found."""
+    handler, commit = github_repo
+
+    assert handler.get(commit, "data/missing.json") is None
+    assert handler.get(commit, "data", blob_reader=bytes) is None
+
+def test_github_get_unreachable_repo(github_env):
+    """Test that a repository that cannot be cloned is not reported as a missing file."""
+    handler = GithubHandler(f"file://{github_env}/missing/data.git")
+
+    assert handler.get("0" * 40, "data/hk.json") is None
+
+def test_github_put_then_get(github_repo):
+    """Test that put pushes the file and returns the remote commit hash."""
+    handler, _ = github_repo
+
+    commit = handler.put(json.dumps({"a": 2}), "data", "json", "hk")
+
+    assert commit == git("ls-remote", handler.REPO_URL, "refs/heads/main").split("\t")[0]
+    assert handler.get(commit, "data/hk.json") == {"a": 2}
+
+def test_github_put_no_changes(github_repo):
+    """Test that putting unchanged content keeps the current commit."""
+    handler, commit = github_repo
+
+    assert handler.put('{"a": 1}\n', "data", "json", "hk") == commit
+
+def test_github_put_batch(github_repo):
+    """Test that put_batch commits files in nested folders with a single commit."""
+    handler, previous = github_repo
+    entries = [
+        {"content": str(i), "folder_name": "batch/nested", "file_ext": "txt", "hotkey": f"hk{i}"}
+        for i in range(3)
+    ]
+
+    commit = handler.put_batch(entries)
+
+    assert git("rev-parse", f"{commit}^", cwd=handler.mirror_path) == previous
+    for i in range(3):
+        assert handler.get(commit, f"batch/nested/hk{i}.txt", blob_reader=bytes) == str(i).encode()
+
+def test_github_mirror_per_url(github_env):
+    """Test that repositories with the same name from different owners do not share a mirror."""
+    first = GithubHandler(create_remote(github_env, "org1", {"hk.json": "1"}))
+    second = GithubHandler(create_remote(github_env, "org2", {"hk.json": "2"}))
+    assert first.mirror_path != second.mirror_path
+
+    commit = second.put("3", ".", "json", "hk")
+
+    assert commit == git("ls-remote", second.REPO_URL, "refs/heads/main").split("\t")[0]
+    assert second.get(commit, "hk.json", blob_reader=bytes) == b"3"
@@ -1,3 +1,7 @@
+import time
+import asyncio
+import threading
+
 from atom.organic_scoring.organic_queue import OrganicQueue
 from atom.mock.mock_identities import MockValidator
 
@@ -20,3 +24,34 @@ def test_organic_queue():
 def test_organic_validator():
     organic_config = {"trigger_frequency": 1, "trigger": "steps"}
     organic_validator = MockValidator(organic_config=organic_config)
+
+
+# Ensure that the step counter can be updated from synchronous code.
+def test_organic_validator_steps():
+    organic_config = {"trigger_frequency": 1, "trigger": "steps"}
+    organic_validator = MockValidator(organic_config=organic_config).organic_validator
+
+    organic_validator.increment_step()
+    organic_validator.increment_step()
+    assert organic_validator._step_counter == 2
+
+    organic_validator.set_step(5)
+    assert organic_validator._step_counter == 5
+
+
+# Ensure that steps incremented from another thread wake up a waiter on its own event loop.
+def test_organic_validator_steps_from_thread():
+    organic_config = {"trigger_frequency": 1, "trigger": "steps"}
+    organic_validator = MockValidator(organic_config=organic_config).organic_validator
+
+    def increment_steps():
+        for _ in range(3):
+            time.sleep(0.01)
+            organic_validator.increment_step()
+
+    thread = threading.Thread(target=increment_steps)
+    thread.start()
+    asyncio.run(asyncio.wait_for(organic_validator._wait_for_steps(3), timeout=5))
+    thread.join()
+
+    assert organic_validator._step_counter == 3
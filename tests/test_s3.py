@@ -1,6 +1,6 @@
 import pytest
 from unittest.mock import patch
-from atom.handlers.handler import create_s3_client
+from atom.handlers.handler import S3_CLIENT_CONFIG, S3Handler, create_s3_client
 
 @patch("boto3.session.Session.client")
 def test_create_s3_client(mock_boto_client):
@@ -19,6 +19,18 @@ def test_create_s3_client(mock_boto_client):
         endpoint_url="http://mock-endpoint",
         aws_access_key_id="mock-access-key",
         aws_secret_access_key="mock-secret-key",
+        config=S3_CLIENT_CONFIG,
     )
 
     assert client == mock_s3
+
+@patch("atom.handlers.handler.create_s3_client")
+def test_default_client_is_shared(mock_create_s3_client):
+    S3Handler._default_client.cache_clear()
+
+    first = S3Handler(bucket_name="bucket-a")
+    second = S3Handler(bucket_name="bucket-b")
+
+    mock_create_s3_client.assert_called_once()
+    assert first.s3_client is second.s3_client is mock_create_s3_client.return_value
+    S3Handler._default_client.cache_clear()